@@ -1,34 +1,54 @@
-import importlib
-from typing import List, Optional, Union
+import importlib.util
+from typing import Any, List, Optional, Tuple, TYPE_CHECKING, Union
 
 import applications_superstaq
 import cirq
 
 import cirq_superstaq
 
-try:
+if TYPE_CHECKING:  # pragma: no cover
     import qtrl.sequencer
-except ModuleNotFoundError:
-    pass
+
+_HAS_QTRL = importlib.util.find_spec("qtrl") is not None
 
 
 class CompilerOutput:
-    def __init__(
-        self,
+    """Compiled circuit(s) returned by a SuperstaQ compilation endpoint.
+
+    Constructing a CompilerOutput returns an instance of one of two subclasses: one with .circuit
+    and .pulse_list attributes if `circuits` is a single Circuit, or one with .circuits and
+    .pulse_lists attributes otherwise.
+    """
+
+    __slots__ = ()
+
+    seq: Optional["qtrl.sequencer.Sequence"]
+    jaqal_programs: Optional[Union[str, List[str]]]
+
+    _has_multiple_circuits: bool
+
+    def __new__(
+        cls,
         circuits: Union[cirq.Circuit, List[cirq.Circuit]],
         seq: Optional["qtrl.sequencer.Sequence"] = None,
-        jaqal_programs: List[str] = None,
+        jaqal_programs: Optional[Union[str, List[str]]] = None,
         pulse_lists: Optional[Union[List[List], List[List[List]]]] = None,
-    ) -> None:
+    ) -> "CompilerOutput":
+        out: CompilerOutput
         if isinstance(circuits, cirq.Circuit):
-            self.circuit = circuits
-            self.pulse_list = pulse_lists
+            single_out = object.__new__(_SingleCompilerOutput)
+            single_out.circuit = circuits
+            single_out.pulse_list = pulse_lists
+            out = single_out
         else:
-            self.circuits = circuits
-            self.pulse_lists = pulse_lists
+            multi_out = object.__new__(_MultiCompilerOutput)
+            multi_out.circuits = circuits
+            multi_out.pulse_lists = pulse_lists
+            out = multi_out
 
-        self.seq = seq
-        self.jaqal_programs = jaqal_programs
+        out.seq = seq
+        out.jaqal_programs = jaqal_programs
+        return out
 
     def has_multiple_circuits(self) -> bool:
         """Returns True if this object represents multiple circuits.
@@ -36,14 +56,39 @@ class CompilerOutput:
         If so, this object has .circuits and .pulse_lists attributes. Otherwise, this object
         represents a single circuit, and has .circuit and .pulse_list attributes.
         """
-        return hasattr(self, "circuits")
+        return self._has_multiple_circuits
+
+
+class _SingleCompilerOutput(CompilerOutput):
+    __slots__ = ("circuit", "seq", "jaqal_programs", "pulse_list")
+
+    circuit: cirq.Circuit
+    pulse_list: Optional[Union[List[List], List[List[List]]]]
+
+    _has_multiple_circuits = False
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return CompilerOutput, (self.circuit, self.seq, self.jaqal_programs, self.pulse_list)
+
+    def __repr__(self) -> str:
+        return (
+            f"CompilerOutput({self.circuit!r}, {self.seq!r}, {self.jaqal_programs!r}, "
+            f"{self.pulse_list!r})"
+        )
+
+
+class _MultiCompilerOutput(CompilerOutput):
+    __slots__ = ("circuits", "seq", "jaqal_programs", "pulse_lists")
+
+    circuits: List[cirq.Circuit]
+    pulse_lists: Optional[Union[List[List], List[List[List]]]]
+
+    _has_multiple_circuits = True
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return CompilerOutput, (self.circuits, self.seq, self.jaqal_programs, self.pulse_lists)
 
     def __repr__(self) -> str:
-        if not self.has_multiple_circuits():
-            return (
-                f"CompilerOutput({self.circuit!r}, {self.seq!r}, {self.jaqal_programs!r}, "
-                f"{self.pulse_list!r})"
-            )
         return (
             f"CompilerOutput({self.circuits!r}, {self.seq!r}, {self.jaqal_programs!r}, "
             f"{self.pulse_lists!r})"
@@ -65,9 +110,10 @@ def read_json_aqt(json_dict: dict, circuits_list: bool) -> CompilerOutput:
     seq = None
     pulse_lists = None
 
-    if importlib.util.find_spec(
-        "qtrl"
-    ):  # pragma: no cover, b/c qtrl is not open source so it is not in cirq-superstaq reqs
+    if _HAS_QTRL:  # pragma: no cover, b/c qtrl is not open source so not in cirq-superstaq reqs
+        # qtrl is only imported once it's actually needed
+        import qtrl.sequencer
+
         state = applications_superstaq.converters.deserialize(json_dict["state_jp"])
 
         seq = qtrl.sequencer.Sequence(n_elements=1)
@@ -77,7 +123,7 @@ def read_json_aqt(json_dict: dict, circuits_list: bool) -> CompilerOutput:
         pulse_lists = applications_superstaq.converters.deserialize(json_dict["pulse_lists_jp"])
 
     compiled_circuits = cirq_superstaq.serialization.deserialize_circuits(
-        json_dict["cirq_circuits"]
+        json_dict["cirq_circuits"], limit=None if circuits_list else 1
     )
     if circuits_list:
         return CompilerOutput(circuits=compiled_circuits, seq=seq, pulse_lists=pulse_lists)
@@ -99,7 +145,7 @@ def read_json_qscout(json_dict: dict, circuits_list: bool) -> CompilerOutput:
     """
 
     compiled_circuits = cirq_superstaq.serialization.deserialize_circuits(
-        json_dict["cirq_circuits"]
+        json_dict["cirq_circuits"], limit=None if circuits_list else 1
     )
 
     if circuits_list:
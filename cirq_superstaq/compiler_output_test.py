@@ -1,4 +1,5 @@
 import importlib
+import pickle
 import textwrap
 from unittest import mock
 
@@ -23,6 +24,31 @@ def test_aqt_out_repr() -> None:
     )
 
 
+def test_compiler_output() -> None:
+    circuit = cirq.Circuit()
+
+    out = compiler_output.CompilerOutput(circuit)
+    assert isinstance(out, compiler_output._SingleCompilerOutput)
+    assert isinstance(out, compiler_output.CompilerOutput)
+    assert not out.has_multiple_circuits()
+    assert out.circuit is circuit
+    assert not hasattr(out, "circuits")
+    assert not hasattr(out, "__dict__")
+
+    out = compiler_output.CompilerOutput([circuit, circuit])
+    assert isinstance(out, compiler_output._MultiCompilerOutput)
+    assert isinstance(out, compiler_output.CompilerOutput)
+    assert out.has_multiple_circuits()
+    assert out.circuits == [circuit, circuit]
+    assert not hasattr(out, "circuit")
+    assert not hasattr(out, "__dict__")
+
+    out = compiler_output.CompilerOutput(circuits=circuit, jaqal_programs="program")
+    assert repr(pickle.loads(pickle.dumps(out))) == repr(out)
+    out = compiler_output.CompilerOutput(circuits=[circuit], pulse_lists=[[[]]])
+    assert repr(pickle.loads(pickle.dumps(out))) == repr(out)
+
+
 @mock.patch.dict("sys.modules", {"qtrl": None})
 def test_read_json() -> None:
     importlib.reload(compiler_output)
@@ -40,24 +66,33 @@ def test_read_json() -> None:
     }
 
     out = compiler_output.read_json_aqt(json_dict, circuits_list=False)
+    assert isinstance(out, compiler_output._SingleCompilerOutput)
     assert out.circuit == circuit
     assert not hasattr(out, "circuits")
 
     out = compiler_output.read_json_aqt(json_dict, circuits_list=True)
+    assert isinstance(out, compiler_output._MultiCompilerOutput)
     assert out.circuits == [circuit]
     assert not hasattr(out, "circuit")
 
     # multiple circuits
+    other_circuit = cirq.Circuit(cirq.X(cirq.LineQubit(5)))
     pulse_lists_str = applications_superstaq.converters.serialize([[[]], [[]]])
     json_dict = {
-        "cirq_circuits": cirq_superstaq.serialization.serialize_circuits([circuit, circuit]),
+        "cirq_circuits": cirq_superstaq.serialization.serialize_circuits([circuit, other_circuit]),
         "state_jp": state_str,
         "pulse_lists_jp": pulse_lists_str,
     }
     out = compiler_output.read_json_aqt(json_dict, circuits_list=True)
-    assert out.circuits == [circuit, circuit]
+    assert isinstance(out, compiler_output._MultiCompilerOutput)
+    assert out.circuits == [circuit, other_circuit]
     assert not hasattr(out, "circuit")
 
+    out = compiler_output.read_json_aqt(json_dict, circuits_list=False)
+    assert isinstance(out, compiler_output._SingleCompilerOutput)
+    assert out.circuit == circuit
+    assert not hasattr(out, "circuits")
+
 
 def test_read_json_with_qscout() -> None:
     q0 = cirq.LineQubit(0)
@@ -79,13 +114,22 @@ def test_read_json_with_qscout() -> None:
     }
 
     out = compiler_output.read_json_qscout(json_dict, circuits_list=False)
+    assert isinstance(out, compiler_output._SingleCompilerOutput)
     assert out.circuit == circuit
     assert out.jaqal_programs == jaqal_program
 
+    other_circuit = cirq.Circuit(cirq.X(q0), cirq.measure(q0))
+    other_jaqal_program = jaqal_program.replace("-1.5707963267948966", "0")
     json_dict = {
-        "cirq_circuits": cirq_superstaq.serialization.serialize_circuits([circuit, circuit]),
-        "jaqal_programs": [jaqal_program, jaqal_program],
+        "cirq_circuits": cirq_superstaq.serialization.serialize_circuits([circuit, other_circuit]),
+        "jaqal_programs": [jaqal_program, other_jaqal_program],
     }
     out = compiler_output.read_json_qscout(json_dict, circuits_list=True)
-    assert out.circuits == [circuit, circuit]
+    assert isinstance(out, compiler_output._MultiCompilerOutput)
+    assert out.circuits == [circuit, other_circuit]
     assert out.jaqal_programs == json_dict["jaqal_programs"]
+
+    out = compiler_output.read_json_qscout(json_dict, circuits_list=False)
+    assert isinstance(out, compiler_output._SingleCompilerOutput)
+    assert out.circuit == circuit
+    assert out.jaqal_programs == jaqal_program
@@ -1,5 +1,7 @@
 """Miscellaneous custom gates that we encounter and want to explicitly define."""
 
+import bisect
+import itertools
 from typing import AbstractSet, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import cirq
@@ -33,12 +35,15 @@ class FermionicSWAPGate(cirq.Gate, cirq.ops.gate_features.InterchangeableQubitsG
     Note that this gate is NOT the same as ``cirq.FSimGate``.
     """
 
+    __slots__ = ("theta", "_rz")
+
     def __init__(self, theta: float) -> None:
         """
         Args:
             theta: ZZ-interaction angle in radians
         """
         self.theta = cirq.ops.fsim_gate._canonicalize(theta)  # between -pi and +pi
+        self._rz: Optional[cirq.Gate] = None  # created on first decomposition
 
     def _num_qubits_(self) -> int:
         return 2
@@ -46,14 +51,11 @@ class FermionicSWAPGate(cirq.Gate, cirq.ops.gate_features.InterchangeableQubitsG
     def _unitary_(self) -> Optional[np.ndarray]:
         if self._is_parameterized_():
             return None
-        return np.array(
-            [
-                [1, 0, 0, 0],
-                [0, 0, np.exp(1j * self.theta), 0],
-                [0, np.exp(1j * self.theta), 0, 0],
-                [0, 0, 0, 1],
-            ]
-        )
+        phase = np.exp(1j * self.theta)
+        unitary = np.zeros((4, 4), dtype=np.complex128)
+        unitary[0, 0] = unitary[3, 3] = 1
+        unitary[1, 2] = unitary[2, 1] = phase
+        return unitary
 
     def _value_equality_values_(self) -> Any:
         return self.theta
@@ -61,8 +63,12 @@ class FermionicSWAPGate(cirq.Gate, cirq.ops.gate_features.InterchangeableQubitsG
     def __pow__(
         self, exponent: float
     ) -> Union["FermionicSWAPGate", cirq.type_workarounds.NotImplementedType]:
-        if exponent in (-1, 0, 1):
-            return FermionicSWAPGate(exponent * self.theta)
+        if exponent == 1:
+            return self
+        if exponent == 0:
+            return _FSWAP_ZERO
+        if exponent == -1:
+            return FermionicSWAPGate(-self.theta)
         return NotImplemented
 
     def __str__(self) -> str:
@@ -72,10 +78,13 @@ class FermionicSWAPGate(cirq.Gate, cirq.ops.gate_features.InterchangeableQubitsG
         return f"cirq_superstaq.FermionicSWAPGate({self.theta})"
 
     def _decompose_(self, qubits: Tuple[cirq.Qid, cirq.Qid]) -> cirq.OP_TREE:
-        yield cirq.CX(qubits[0], qubits[1])
-        yield cirq.CX(qubits[1], qubits[0])
-        yield cirq.rz(self.theta)(qubits[1])
-        yield cirq.CX(qubits[0], qubits[1])
+        if self._rz is None:
+            self._rz = cirq.rz(self.theta)
+        q0, q1 = qubits
+        yield cirq.CX(q0, q1)
+        yield cirq.CX(q1, q0)
+        yield self._rz(q1)
+        yield cirq.CX(q0, q1)
 
     def _circuit_diagram_info_(self, args: cirq.CircuitDiagramInfoArgs) -> cirq.CircuitDiagramInfo:
         t = args.format_radians(self.theta)
@@ -101,10 +110,14 @@ class FermionicSWAPGate(cirq.Gate, cirq.ops.gate_features.InterchangeableQubitsG
         zo = args.subspace_index(0b01)
         oz = args.subspace_index(0b10)
         args.available_buffer[zo] = args.target_tensor[zo]
-        args.target_tensor[zo] = args.target_tensor[oz]
-        args.target_tensor[oz] = args.available_buffer[zo]
-        args.target_tensor[zo] *= np.exp(1j * self.theta)
-        args.target_tensor[oz] *= np.exp(1j * self.theta)
+        if self.theta == 0:  # ordinary SWAP, so the slices don't need to be rescaled
+            args.target_tensor[zo] = args.target_tensor[oz]
+            args.target_tensor[oz] = args.available_buffer[zo]
+            return args.target_tensor
+
+        phase = np.exp(1j * self.theta)
+        args.target_tensor[zo] = args.target_tensor[oz] * phase
+        args.target_tensor[oz] = args.available_buffer[zo] * phase
         return args.target_tensor
 
     def _pauli_expansion_(
@@ -112,17 +125,22 @@ class FermionicSWAPGate(cirq.Gate, cirq.ops.gate_features.InterchangeableQubitsG
     ) -> Union[cirq.value.LinearDict[str], cirq.type_workarounds.NotImplementedType]:
         if cirq.protocols.is_parameterized(self):
             return NotImplemented
+        half_phase = 0.5 * np.exp(1j * self.theta)
         return cirq.value.LinearDict(
             {
                 "II": 0.5,
-                "XX": 0.5 * np.exp(1j * self.theta),
-                "YY": 0.5 * np.exp(1j * self.theta),
+                "XX": half_phase,
+                "YY": half_phase,
                 "ZZ": 0.5,
             }
         )
 
     def _qasm_(self, args: cirq.QasmArgs, qubits: Tuple[cirq.Qid, cirq.Qid]) -> Optional[str]:
-        if np.isclose(self.theta, 0.0):
+        if self._is_parameterized_():
+            return None
+
+        # same tolerance as np.isclose(self.theta, 0.0), without the ufunc overhead
+        if abs(self.theta) <= 1e-8:
             return cirq.SWAP._qasm_(args, qubits)
 
         return args.format(
@@ -136,6 +154,17 @@ class FermionicSWAPGate(cirq.Gate, cirq.ops.gate_features.InterchangeableQubitsG
         return cirq.protocols.obj_to_dict_helper(self, ["theta"])
 
 
+_FSWAP_ZERO = FermionicSWAPGate(0.0)
+
+
+# Projectors onto the eigenspaces of ZX (eigenvalues +1 and -1), which don't depend on the exponent
+_ZX_EIGEN_0 = np.array([[0.5, 0.5, 0, 0], [0.5, 0.5, 0, 0], [0, 0, 0.5, -0.5], [0, 0, -0.5, 0.5]])
+_ZX_EIGEN_1 = np.array([[0.5, -0.5, 0, 0], [-0.5, 0.5, 0, 0], [0, 0, 0.5, 0.5], [0, 0, 0.5, 0.5]])
+_ZX_EIGEN_0.flags.writeable = False
+_ZX_EIGEN_1.flags.writeable = False
+_ZX_EIGEN = ((0.0, _ZX_EIGEN_0), (1.0, _ZX_EIGEN_1))
+
+
 class ZXPowGate(cirq.EigenGate, cirq.Gate):
     r"""The ZX-parity gate, possibly raised to a power.
     Per arxiv.org/pdf/1904.06560v3 eq. 135, the ZX**t gate implements the following unitary:
@@ -151,20 +180,7 @@ class ZXPowGate(cirq.EigenGate, cirq.Gate):
     """
 
     def _eigen_components(self) -> List[Tuple[float, np.ndarray]]:
-        return [
-            (
-                0.0,
-                np.array(
-                    [[0.5, 0.5, 0, 0], [0.5, 0.5, 0, 0], [0, 0, 0.5, -0.5], [0, 0, -0.5, 0.5]]
-                ),
-            ),
-            (
-                1.0,
-                np.array(
-                    [[0.5, -0.5, 0, 0], [-0.5, 0.5, 0, 0], [0, 0, 0.5, 0.5], [0, 0, 0.5, 0.5]]
-                ),
-            ),
-        ]
+        return list(_ZX_EIGEN)
 
     def _eigen_shifts(self) -> List[float]:
         return [0, 1]
@@ -207,9 +223,28 @@ CR = ZX = ZXPowGate()  # standard CR is a full turn of ZX, i.e. exponent = 1
 
 
 class AceCR(cirq.Gate):
-    def __init__(self, polarity: str) -> None:
-        assert polarity in ["+-", "-+"]
-        self.polarity = polarity
+    __slots__ = ("polarity", "_hash", "_polarity_qasm")
+
+    polarity: str
+    _hash: int
+    _polarity_qasm: str
+
+    # there are only two valid polarities, so every AceCR is one of two shared instances
+    _instances: Dict[str, "AceCR"] = {}
+
+    def __new__(cls, polarity: str) -> "AceCR":
+        instance = cls._instances.get(polarity)
+        if instance is None:
+            assert polarity in ["+-", "-+"]
+            instance = super().__new__(cls)
+            instance.polarity = polarity
+            instance._hash = hash(polarity)
+            instance._polarity_qasm = "pm" if polarity == "+-" else "mp"
+            cls._instances[polarity] = instance
+        return instance
+
+    def __getnewargs__(self) -> Tuple[str]:
+        return (self.polarity,)
 
     def _num_qubits_(self) -> int:
         return 2
@@ -232,21 +267,18 @@ class AceCR(cirq.Gate):
 
     def _qasm_(self, args: cirq.QasmArgs, qubits: Tuple[cirq.Qid, cirq.Qid]) -> Optional[str]:
         """QASM symbol for AceCR('+-') (AceCR('-+')) is acecr_pm (acecr_mp)"""
-        polarity_str = self.polarity.replace("+", "p").replace("-", "m")
         return args.format(
             "acecr_{0} {1},{2};\n",
-            polarity_str,
+            self._polarity_qasm,
             qubits[0],
             qubits[1],
         )
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, AceCR):
-            return False
-        return self.polarity == other.polarity
+        return self is other or (isinstance(other, AceCR) and self.polarity == other.polarity)
 
     def __hash__(self) -> int:
-        return hash(self.polarity)
+        return self._hash
 
     def __repr__(self) -> str:
         return f"cirq_superstaq.AceCR('{self.polarity}')"
@@ -268,13 +300,20 @@ class Barrier(cirq.ops.IdentityGate):
     Otherwise equivalent to the identity gate.
     """
 
+    __slots__ = ("_qasm_format",)
+
+    def __init__(
+        self, num_qubits: Optional[int] = None, qid_shape: Optional[Tuple[int, ...]] = None
+    ) -> None:
+        super().__init__(num_qubits=num_qubits, qid_shape=qid_shape)
+        indices_str = ",".join(f"{{{i}}}" for i in range(self.num_qubits()))
+        self._qasm_format = f"barrier {indices_str};\n"
+
     def _decompose_(self, qubits: Sequence["cirq.Qid"]) -> cirq.type_workarounds.NotImplementedType:
         return NotImplemented
 
     def _qasm_(self, args: cirq.QasmArgs, qubits: Tuple[cirq.Qid, ...]) -> str:
-        indices_str = ",".join([f"{{{i}}}" for i in range(len(qubits))])
-        format_str = f"barrier {indices_str};\n"
-        return args.format(format_str, *qubits)
+        return args.format(self._qasm_format, *qubits)
 
     def __str__(self) -> str:
         return f"Barrier({self.num_qubits()})"
@@ -288,6 +327,9 @@ class Barrier(cirq.ops.IdentityGate):
         return ("|",) * self.num_qubits()
 
 
+_SUB_TABLE = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+
+
 @cirq.value_equality(approximate=True)
 class ParallelGates(cirq.Gate, cirq.InterchangeableQubitsGate):
     """A single Gate combining a collection of concurrent Gate(s) acting on different qubits"""
@@ -299,21 +341,34 @@ class ParallelGates(cirq.Gate, cirq.InterchangeableQubitsGate):
         """
         if any(cirq.is_measurement(gate) for gate in component_gates):
             raise ValueError("ParallelGates cannot contain measurements")
+        self._init_unchecked(component_gates)
+
+    @classmethod
+    def _from_tuple(cls, component_gates: Tuple[cirq.Gate, ...]) -> "ParallelGates":
+        """Constructs a ParallelGates from gates already known not to contain measurements."""
+        gate = cls.__new__(cls)
+        gate._init_unchecked(component_gates)
+        return gate
+
+    def _init_unchecked(self, component_gates: Tuple[cirq.Gate, ...]) -> None:
         self.component_gates = component_gates
 
+        # cumulative qubit counts, i.e. the (exclusive) end index of each component gate
+        self._prefix = tuple(itertools.accumulate(gate.num_qubits() for gate in component_gates))
+        self._total = self._prefix[-1] if self._prefix else 0
+
     def qubit_index_to_gate_and_index(self, index: int) -> Tuple[cirq.Gate, int]:
-        for gate in self.component_gates:
-            if gate.num_qubits() > index >= 0:
-                return gate, index
-            index -= gate.num_qubits()
-        raise ValueError("index out of range")
+        if not 0 <= index < self._total:
+            raise ValueError("index out of range")
+        i = bisect.bisect_right(self._prefix, index)
+        return self.component_gates[i], index - (self._prefix[i - 1] if i else 0)
 
     def qubit_index_to_equivalence_group_key(self, index: int) -> int:
         indexed_gate, index_in_gate = self.qubit_index_to_gate_and_index(index)
         if indexed_gate.num_qubits() == 1:
             # find the first instance of the same gate
             first_instance = self.component_gates.index(indexed_gate)
-            return sum(map(cirq.num_qubits, self.component_gates[:first_instance]))
+            return self._prefix[first_instance - 1] if first_instance else 0
         if isinstance(indexed_gate, cirq.InterchangeableQubitsGate):
             gate_key = indexed_gate.qubit_index_to_equivalence_group_key(index_in_gate)
             for i in range(index_in_gate):
@@ -325,14 +380,14 @@ class ParallelGates(cirq.Gate, cirq.InterchangeableQubitsGate):
         return self.component_gates
 
     def _num_qubits_(self) -> int:
-        return sum(map(cirq.num_qubits, self.component_gates))
+        return self._total
 
     def _decompose_(self, qubits: Tuple[cirq.Qid, ...]) -> cirq.OP_TREE:
         """Decompose into each component gate"""
-        for gate in self.component_gates:
-            num_qubits = gate.num_qubits()
-            yield gate(*qubits[:num_qubits])
-            qubits = qubits[num_qubits:]
+        start = 0
+        for gate, end in zip(self.component_gates, self._prefix):
+            yield gate(*qubits[start:end])
+            start = end
 
     def _circuit_diagram_info_(self, args: cirq.CircuitDiagramInfoArgs) -> cirq.CircuitDiagramInfo:
         """Generate a circuit diagram by connecting the wire symbols of each component gate.
@@ -340,17 +395,20 @@ class ParallelGates(cirq.Gate, cirq.InterchangeableQubitsGate):
         Symbols belonging to separate gates are differentiated via subscripts, with groups of
         symbols sharing the same subscript indicating multi-qubit operations.
         """
+        circuit_diagram_info = cirq.circuit_diagram_info
+        num_qubits = cirq.num_qubits
+
         wire_symbols_with_subscripts = []
         for i, gate in enumerate(self.component_gates):
-            diagram_info = cirq.circuit_diagram_info(gate, args)
+            diagram_info = circuit_diagram_info(gate, args)
             full_wire_symbols = diagram_info._wire_symbols_including_formatted_exponent(
                 args,
-                preferred_exponent_index=cirq.num_qubits(gate) - 1,
+                preferred_exponent_index=num_qubits(gate) - 1,
             )
 
             index_str = f"_{i+1}"
             if args.use_unicode_characters:
-                index_str = "".join(chr(ord("₁") + int(c)) for c in str(i))
+                index_str = str(i + 1).translate(_SUB_TABLE)
 
             for base_symbol, full_symbol in zip(diagram_info.wire_symbols, full_wire_symbols):
                 wire_symbols_with_subscripts.append(
@@ -366,8 +424,10 @@ class ParallelGates(cirq.Gate, cirq.InterchangeableQubitsGate):
         return cls(*component_gates)
 
     def __pow__(self, exponent: float) -> "ParallelGates":
-        exponentiated_gates = [gate ** exponent for gate in self.component_gates]
-        return ParallelGates(*exponentiated_gates)
+        if exponent == 1:
+            return self
+        # exponentiation can't introduce measurements, so there's no need to re-validate
+        return ParallelGates._from_tuple(tuple(gate ** exponent for gate in self.component_gates))
 
     def __str__(self) -> str:
         component_gates_str = ", ".join(str(gate) for gate in self.component_gates)
@@ -391,6 +451,9 @@ class MSGate(cirq.ion.ion_gates.MSGate):
         return cls(rads=rads)
 
 
+_INV_PI = 1.0 / np.pi
+
+
 @cirq.value_equality(approximate=True)
 class Rphi(cirq.PhasedXPowGate):
     """A single-qubit gate that rotates about an axis in the X-Y plane."""
@@ -403,15 +466,18 @@ class Rphi(cirq.PhasedXPowGate):
 
             theta (float): angle (in radians) by which to rotate.
         """
-        super().__init__(phase_exponent=phi / np.pi, exponent=theta / np.pi, global_shift=-0.5)
+        super().__init__(phase_exponent=phi * _INV_PI, exponent=theta * _INV_PI, global_shift=-0.5)
+        # cache the canonicalized angles so the properties below don't recompute them
+        self._phi = self.phase_exponent * np.pi
+        self._theta = self.exponent * np.pi
 
     @property
     def phi(self) -> float:
-        return self.phase_exponent * np.pi
+        return self._phi
 
     @property
     def theta(self) -> float:
-        return self.exponent * np.pi
+        return self._theta
 
     def __pow__(self, power: float) -> "Rphi":
         return Rphi(self.phi, power * self.theta)
@@ -488,22 +554,17 @@ class ParallelRphi(cirq.ParallelGate, cirq.InterchangeableQubitsGate):
         return cirq.protocols.obj_to_dict_helper(self, ["phi", "theta", "num_copies"])
 
 
+_CUSTOM_RESOLVERS: Dict[str, Callable[..., cirq.Gate]] = {
+    "FermionicSWAPGate": FermionicSWAPGate,
+    "Barrier": Barrier,
+    "ZXPowGate": ZXPowGate,
+    "AceCR": AceCR,
+    "ParallelGates": ParallelGates,
+    "MSGate": MSGate,
+    "Rphi": Rphi,
+    "ParallelRphi": ParallelRphi,
+}
+
+
 def custom_resolver(cirq_type: str) -> Union[Callable[..., cirq.Gate], None]:
-    if cirq_type == "FermionicSWAPGate":
-        return FermionicSWAPGate
-    if cirq_type == "Barrier":
-        return Barrier
-    if cirq_type == "ZXPowGate":
-        return ZXPowGate
-    if cirq_type == "AceCR":
-        return AceCR
-    if cirq_type == "ParallelGates":
-        return ParallelGates
-    if cirq_type == "MSGate":
-        return MSGate
-    if cirq_type == "Rphi":
-        return Rphi
-    if cirq_type == "ParallelRphi":
-        return ParallelRphi
-
-    return None
+    return _CUSTOM_RESOLVERS.get(cirq_type)
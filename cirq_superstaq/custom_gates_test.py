@@ -1,4 +1,7 @@
+import copy
 import itertools
+import json
+import pickle
 import textwrap
 
 import cirq
@@ -30,20 +33,33 @@ def test_fermionic_swap_gate() -> None:
         cirq.rz(theta).on(qubits[2]),
         cirq.CX(qubits[0], qubits[2]),
     ]
+    assert cirq.decompose_once(gate(qubits[1], qubits[0]))[2] == cirq.rz(theta).on(qubits[0])
 
     cirq.testing.assert_has_consistent_apply_unitary(gate)
     cirq.testing.assert_decompose_is_consistent_with_unitary(gate, ignoring_global_phase=True)
     cirq.testing.assert_consistent_resolve_parameters(gate)
     cirq.testing.assert_pauli_expansion_is_consistent_with_unitary(gate)
 
-    assert gate ** 1 == gate
+    assert gate ** 1 is gate
     assert gate ** 0 == cirq_superstaq.FermionicSWAPGate(0.0)
     assert gate ** -1 == cirq_superstaq.FermionicSWAPGate(-0.123)
 
+    assert copy.deepcopy(gate) == gate
+    assert pickle.loads(pickle.dumps(gate)) == gate
+
     with pytest.raises(TypeError, match="unsupported operand type"):
         _ = gate ** 1.23
 
 
+def test_fermionic_swap_simulation() -> None:
+    qubits = cirq.LineQubit.range(2)
+    for theta in (0.0, 0.3):
+        gate = cirq_superstaq.FermionicSWAPGate(theta)
+        circuit = cirq.Circuit(cirq.X(qubits[0]), gate(*qubits))
+        state = cirq.Simulator().simulate(circuit).final_state_vector
+        np.testing.assert_allclose(state, [0, np.exp(1j * theta), 0, 0], atol=1e-6)
+
+
 def test_fermionic_swap_circuit() -> None:
     qubits = cirq.LineQubit.range(3)
     operation = cirq_superstaq.FermionicSWAPGate(0.456 * np.pi)(qubits[0], qubits[2])
@@ -77,6 +93,24 @@ def test_fermionic_swap_circuit() -> None:
     circuit = cirq.Circuit(cirq_superstaq.FermionicSWAPGate(0.0)(qubits[0], qubits[1]))
     assert circuit.to_qasm() == cirq.Circuit(cirq.SWAP(qubits[0], qubits[1])).to_qasm()
 
+    circuit = cirq.Circuit(cirq_superstaq.FermionicSWAPGate(1e-9)(qubits[0], qubits[1]))
+    assert circuit.to_qasm() == cirq.Circuit(cirq.SWAP(qubits[0], qubits[1])).to_qasm()
+
+
+def test_fermionic_swap_zero_theta() -> None:
+    gate = cirq_superstaq.FermionicSWAPGate(0.0)
+    cirq.testing.assert_has_consistent_apply_unitary(gate)
+    np.testing.assert_allclose(cirq.unitary(gate), cirq.unitary(cirq.SWAP))
+
+    state = cirq.testing.random_superposition(8).reshape((2, 2, 2))
+    expected = cirq.apply_unitary(
+        cirq.SWAP, cirq.ApplyUnitaryArgs(state.copy(), np.empty_like(state), axes=(0, 2))
+    )
+    actual = cirq.apply_unitary(
+        gate, cirq.ApplyUnitaryArgs(state.copy(), np.empty_like(state), axes=(0, 2))
+    )
+    np.testing.assert_allclose(actual, expected)
+
 
 def test_fermionic_swap_parameterized() -> None:
     gate = cirq_superstaq.FermionicSWAPGate(sympy.var("θ"))
@@ -88,6 +122,14 @@ def test_fermionic_swap_parameterized() -> None:
     with pytest.raises(TypeError, match="No Pauli expansion"):
         _ = cirq.pauli_expansion(gate)
 
+    qubits = cirq.LineQubit.range(2)
+    assert cirq.qasm(gate, args=cirq.QasmArgs(), qubits=qubits, default=None) is None
+
+    # cirq falls back to the decomposition, which can't be exported with a symbolic angle either
+    circuit = cirq.Circuit(gate(*qubits))
+    with pytest.raises(TypeError):
+        _ = circuit.to_qasm()
+
 
 def test_zx_matrix() -> None:
     np.testing.assert_allclose(
@@ -96,6 +138,14 @@ def test_zx_matrix() -> None:
     )
 
 
+def test_zx_eigen_components_are_shared() -> None:
+    components = cirq_superstaq.ZX._eigen_components()
+    other_components = (cirq_superstaq.ZX ** 0.5)._eigen_components()
+    for (_, projector), (_, other_projector) in zip(components, other_components):
+        assert projector is other_projector
+        assert not projector.flags.writeable
+
+
 def test_zx_str() -> None:
     assert str(cirq_superstaq.ZX) == "ZX"
     assert str(cirq_superstaq.ZX ** 0.5) == "ZX**0.5"
@@ -168,6 +218,14 @@ def test_acecr() -> None:
     assert str(cirq_superstaq.AceCRMinusPlus) == "AceCR-+"
     assert hash(cirq_superstaq.AceCRMinusPlus) == hash("-+")
     assert cirq_superstaq.AceCRPlusMinus != cirq.CNOT
+    assert cirq_superstaq.AceCR("+-") is cirq_superstaq.AceCRPlusMinus
+    assert copy.deepcopy(cirq_superstaq.AceCRMinusPlus) is cirq_superstaq.AceCRMinusPlus
+    assert (
+        pickle.loads(pickle.dumps(cirq_superstaq.AceCRPlusMinus)) is cirq_superstaq.AceCRPlusMinus
+    )
+
+    with pytest.raises(AssertionError):
+        _ = cirq_superstaq.AceCR("++")
 
     expected_qasm = textwrap.dedent(
         """\
@@ -208,6 +266,8 @@ def test_barrier() -> None:
     assert repr(gate) == "cirq_superstaq.Barrier(3)"
 
     cirq.testing.assert_equivalent_repr(gate, setup_code="import cirq_superstaq")
+    resolvers = [cirq_superstaq.custom_gates.custom_resolver, *cirq.DEFAULT_RESOLVERS]
+    assert cirq.read_json(json_text=cirq.to_json(gate), resolvers=resolvers) == gate
 
     operation = gate.on(*cirq.LineQubit.range(3))
     assert cirq.decompose(operation) == [operation]
@@ -293,10 +353,46 @@ def test_parallel_gates() -> None:
     assert gate ** 0.5 == cirq_superstaq.ParallelGates(
         cirq.CZ ** 0.5, cirq.CZ ** 0.25, cirq.CZ ** -0.25
     )
+    assert gate ** 1 is gate
+    assert cirq.num_qubits(gate ** 0.5) == 6
+
+    resolvers = [cirq_superstaq.custom_gates.custom_resolver, *cirq.DEFAULT_RESOLVERS]
+    deserialized_gate = cirq.read_json(json_text=cirq.to_json(gate), resolvers=resolvers)
+    assert deserialized_gate == gate
+    assert cirq.num_qubits(deserialized_gate) == 6
 
     with pytest.raises(ValueError, match="ParallelGates cannot contain measurements"):
         _ = cirq_superstaq.ParallelGates(cirq.X, cirq.MeasurementGate(1, key="1"))
 
+    # ParallelGates JSON can come from outside this library, so it still has to be validated
+    json_dict = {
+        "cirq_type": "ParallelGates",
+        "component_gates": [
+            json.loads(cirq.to_json(cirq.X)),
+            json.loads(cirq.to_json(cirq.MeasurementGate(1, key="1"))),
+        ],
+    }
+    json_text = json.dumps(json_dict)
+    with pytest.raises(ValueError, match="ParallelGates cannot contain measurements"):
+        _ = cirq.read_json(json_text=json_text, resolvers=resolvers)
+
+
+def test_parallel_gates_diagram_subscripts() -> None:
+    gate = cirq_superstaq.ParallelGates(*[cirq.X] * 11)
+    qubits = cirq.LineQubit.range(11)
+    circuit = cirq.Circuit(gate(*qubits))
+
+    wire_symbols = cirq.circuit_diagram_info(gate).wire_symbols
+    assert wire_symbols[0] == "X₁"
+    assert wire_symbols[8] == "X₉"
+    assert wire_symbols[9] == "X₁₀"
+    assert wire_symbols[10] == "X₁₁"
+
+    args = cirq.CircuitDiagramInfoArgs.UNINFORMED_DEFAULT.with_args(use_unicode_characters=False)
+    wire_symbols = cirq.circuit_diagram_info(gate, args).wire_symbols
+    assert wire_symbols[10] == "X_11"
+    assert "X_11" in circuit.to_text_diagram(use_unicode_characters=False)
+
 
 def test_parallel_gates_equivalence_groups() -> None:
     qubits = cirq.LineQubit.range(4)
@@ -331,6 +427,25 @@ def test_parallel_gates_equivalence_groups() -> None:
         _ = gate.qubit_index_to_equivalence_group_key(-1)
 
 
+def test_parallel_gates_qubit_index_to_gate_and_index() -> None:
+    gate = cirq_superstaq.ParallelGates(cirq.X, cirq.CCZ, cirq_superstaq.ZX, cirq.Y)
+    assert cirq.num_qubits(gate) == 7
+    assert [gate.qubit_index_to_gate_and_index(i) for i in range(7)] == [
+        (cirq.X, 0),
+        (cirq.CCZ, 0),
+        (cirq.CCZ, 1),
+        (cirq.CCZ, 2),
+        (cirq_superstaq.ZX, 0),
+        (cirq_superstaq.ZX, 1),
+        (cirq.Y, 0),
+    ]
+
+    with pytest.raises(ValueError, match="index out of range"):
+        _ = gate.qubit_index_to_gate_and_index(7)
+
+    assert cirq.num_qubits(cirq_superstaq.ParallelGates()) == 0
+
+
 def test_rxy() -> None:
     qubit = cirq.LineQubit(0)
 
@@ -338,6 +453,11 @@ def test_rxy() -> None:
     cirq.testing.assert_equivalent_repr(rot_gate, setup_code="import cirq_superstaq")
     assert str(rot_gate) == f"Rphi({rot_gate.phase_exponent}π, {rot_gate.exponent}π)"
     assert rot_gate ** -1 == cirq_superstaq.Rphi(rot_gate.phi, -rot_gate.theta)
+    assert rot_gate.phi == rot_gate.phase_exponent * np.pi
+    assert rot_gate.theta == rot_gate.exponent * np.pi
+    assert np.isclose(rot_gate.phi, -0.77 * np.pi)
+    assert cirq_superstaq.Rphi(3 * np.pi, np.pi).phi == np.pi
+    assert repr(cirq_superstaq.Rphi(np.pi, 0.5)) == repr(cirq_superstaq.Rphi(-np.pi, 0.5))
 
     circuit = cirq.Circuit(rot_gate.on(qubit))
 
@@ -1,4 +1,5 @@
-from typing import List, Sequence, Union
+import json
+from typing import List, Optional, Sequence, Union
 
 import cirq
 
@@ -19,17 +20,52 @@ def serialize_circuits(
     return cirq.to_json(circuits)
 
 
-def deserialize_circuits(serialized_circuits: str) -> List[cirq.Circuit]:
+def _truncate_json_list(json_list: str, limit: int) -> str:
+    """Truncates the json str of a list to its first `limit` elements, without parsing the rest.
+
+    Args:
+        json_list: json str representing a list
+        limit: the number of elements to keep
+
+    Returns:
+        json str of a list containing (at most) the first `limit` elements of `json_list`
+    """
+    decoder = json.JSONDecoder()
+    index = end = json_list.index("[") + 1
+    for _ in range(limit):
+        while index < len(json_list) and json_list[index] in " \t\n\r,":
+            index += 1
+        if index >= len(json_list) or json_list[index] == "]":
+            return json_list
+        _, end = decoder.raw_decode(json_list, index)
+        index = end
+    return json_list[:end] + "]"
+
+
+def deserialize_circuits(
+    serialized_circuits: str, limit: Optional[int] = None
+) -> List[cirq.Circuit]:
     """Deserialize serialized Circuit(s)
 
     Args:
         serialized_circuits: json str generated via converters.serialize_circuit()
+        limit: if provided, only the first `limit` circuits are deserialized
 
     Returns:
         the Circuit or list of Circuits that was serialized
+
+    Raises:
+        ValueError: if `limit` is negative
     """
+    if limit is not None:
+        if limit < 0:
+            raise ValueError("limit must be non-negative")
+        # skip decoding circuits that won't be returned
+        if serialized_circuits.lstrip().startswith("["):
+            serialized_circuits = _truncate_json_list(serialized_circuits, limit)
+
     resolvers = [cirq_superstaq.custom_gates.custom_resolver, *cirq.DEFAULT_RESOLVERS]
     circuits = cirq.read_json(json_text=serialized_circuits, resolvers=resolvers)
     if isinstance(circuits, cirq.Circuit):
-        return [circuits]
-    return circuits
+        circuits = [circuits]
+    return circuits[:limit]
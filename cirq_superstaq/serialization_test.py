@@ -1,4 +1,5 @@
 import cirq
+import pytest
 
 import cirq_superstaq.serialization
 
@@ -15,3 +16,22 @@ def test_serialization() -> None:
     serialized_circuits = cirq_superstaq.serialization.serialize_circuits(circuits)
     assert isinstance(serialized_circuits, str)
     assert cirq_superstaq.serialization.deserialize_circuits(serialized_circuits) == circuits
+
+    assert cirq_superstaq.serialization.deserialize_circuits(serialized_circuits, limit=1) == [
+        circuit
+    ]
+    assert (
+        cirq_superstaq.serialization.deserialize_circuits(serialized_circuits, limit=2) == circuits
+    )
+    assert cirq_superstaq.serialization.deserialize_circuits(serialized_circuit, limit=1) == [
+        circuit
+    ]
+    assert (
+        cirq_superstaq.serialization.deserialize_circuits(serialized_circuits, limit=3) == circuits
+    )
+    assert cirq_superstaq.serialization.deserialize_circuits(serialized_circuits, limit=0) == []
+    assert cirq_superstaq.serialization.deserialize_circuits(serialized_circuit, limit=0) == []
+    assert cirq_superstaq.serialization.deserialize_circuits("[]", limit=1) == []
+
+    with pytest.raises(ValueError, match="non-negative"):
+        _ = cirq_superstaq.serialization.deserialize_circuits(serialized_circuits, limit=-1)
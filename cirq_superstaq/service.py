@@ -14,7 +14,7 @@
 
 import collections
 import os
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, overload, Union
 
 import applications_superstaq
 import cirq
@@ -259,6 +259,18 @@ class Service(finance.Finance, logistics.Logistics, user_config.UserConfig):
         """Get list of available backends."""
         return self._client.get_backends()["superstaq_backends"]
 
+    @overload
+    def aqt_compile(
+        self, circuits: cirq.Circuit, target: str = "keysight"
+    ) -> "cirq_superstaq.compiler_output._SingleCompilerOutput":
+        ...  # pragma: no cover
+
+    @overload
+    def aqt_compile(
+        self, circuits: List[cirq.Circuit], target: str = "keysight"
+    ) -> "cirq_superstaq.compiler_output._MultiCompilerOutput":
+        ...  # pragma: no cover
+
     def aqt_compile(
         self, circuits: Union[cirq.Circuit, List[cirq.Circuit]], target: str = "keysight"
     ) -> "cirq_superstaq.compiler_output.CompilerOutput":
@@ -284,6 +296,18 @@ class Service(finance.Finance, logistics.Logistics, user_config.UserConfig):
 
         return compiler_output.read_json_aqt(json_dict, circuits_list)
 
+    @overload
+    def qscout_compile(
+        self, circuits: cirq.Circuit, target: str = "qscout"
+    ) -> "cirq_superstaq.compiler_output._SingleCompilerOutput":
+        ...  # pragma: no cover
+
+    @overload
+    def qscout_compile(
+        self, circuits: List[cirq.Circuit], target: str = "qscout"
+    ) -> "cirq_superstaq.compiler_output._MultiCompilerOutput":
+        ...  # pragma: no cover
+
     def qscout_compile(
         self, circuits: Union[cirq.Circuit, List[cirq.Circuit]], target: str = "qscout"
     ) -> "cirq_superstaq.compiler_output.CompilerOutput":